@@ -89,8 +89,10 @@ def run_simulation(dataset: str,
 
             print(f"cat {input_data.name} | {' '.join(command)}")
 
+            # stderr is left attached to ours; it is never read here, so piping
+            # it could fill the pipe buffer and stall the simulator
             divert_process = Popen(command, stdin=input_data, stdout=PIPE,
-                    stderr=PIPE, universal_newlines=True)
+                    universal_newlines=True)
             while True:
                 output = divert_process.stdout.readline()
                 if output == '' and divert_process.poll() is not None:
@@ -20,15 +20,21 @@ cleanup() {
 
 trap cleanup INT TERM EXIT
 
+# TODO: The native build only speaks RAPI over a serial device (PtySerial), so
+# socat is needed to bridge the emulator's TCP port to a PTY. A TCP transport
+# in the native build (e.g. --rapi-tcp HOST:PORT) would let us drop socat and
+# the PTY wait entirely.
 echo "Starting serial bridge: ${EMULATOR_HOST}:${EMULATOR_PORT} -> ${RAPI_PTY_PATH}"
 socat -d -d \
   PTY,link="${RAPI_PTY_PATH}",raw,echo=0,waitslave \
   TCP:"${EMULATOR_HOST}:${EMULATOR_PORT}" &
 SOCAT_PID=$!
 
-# Wait for socat to create the PTY and connect
+# Wait for socat to create the PTY and connect. socat normally creates the
+# link within a few milliseconds, so poll every 100ms (30s total) rather than
+# idling for up to a full second on every start.
 echo "Waiting for PTY device ${RAPI_PTY_PATH}..."
-timeout=30
+timeout=300
 while [ ! -e "${RAPI_PTY_PATH}" ]; do
   if ! kill -0 "$SOCAT_PID" 2>/dev/null; then
     echo "ERROR: socat exited before creating PTY"
@@ -39,7 +45,7 @@ while [ ! -e "${RAPI_PTY_PATH}" ]; do
     echo "ERROR: timed out waiting for PTY device"
     exit 1
   fi
-  sleep 1
+  sleep 0.1
 done
 echo "PTY device ready: ${RAPI_PTY_PATH}"
 